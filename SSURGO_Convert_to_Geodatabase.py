@@ -30,23 +30,20 @@ ImportXMLWorkspaceDocument command requires Standard or Advanced license
 import csv
 import datetime
 import gc
-import itertools as it
 import os
 import platform
+import re
 import shutil
 import sys
-import time
 import traceback
-import xml.etree.cElementTree as ET
+import xml.etree.ElementTree as ET
 from importlib import reload
+from operator import itemgetter
 from urllib.request import urlopen
-from typing import Any, Callable, TypeVar
 
 import arcpy
 from arcpy import env
 
-Tist = TypeVar("Tist", tuple, list)
-
 states = {
     'AK': 'Alaska', 'AL': 'Alabama', 'AR': 'Arkansas', 'AS': 'American Samoa',
     'AZ': 'Arizona', 'CA': 'California', 'CO': 'Colorado', 'CT': 'Connecticut',
@@ -66,6 +63,42 @@ states = {
     'WY': 'Wyoming'
 }
 
+# Metadata and lookup tables identical in every SSURGO export
+tabs_common = (
+    'mdstattabcols', 'mdstatrshipdet', 'mdstattabs', 'mdstatrshipmas',
+    'mdstatdommas', 'mdstatidxmas', 'mdstatidxdet',  'mdstatdomdet',
+    'sdvfolder', 'sdvalgorithm'
+)
+# Tables largely common to all surveys, imported as a set of unique rows
+# 'distsubinterpmd'
+tabs_set = ('distinterpmd', 'sdvattribute', 'sdvfolderattribute')
+# Tables which are unique to each SSURGO soil survey area
+tabs_uniq = (
+    'component', 'cosurfmorphhpp', 'legend', 'chunified','cocropyld',
+    'chtexturegrp', 'cosurfmorphss', 'coforprod', 'sacatalog',
+    'cosurfmorphgc', 'cotaxmoistcl', 'chtext', 'chconsistence',
+    'chtexture', 'copmgrp', 'cosoilmoist', 'mucropyld', 'chtexturemod',
+    'cotext', 'coecoclass', 'cosurfmorphmr', 'cosurffrags',
+    'cotreestomng', 'cosoiltemp', 'sainterp', 'chstructgrp',
+    'distlegendmd', 'copwindbreak', 'chdesgnsuffix', 'corestrictions',
+    'cotaxfmmin', 'chstruct', 'chfrags', 'coforprodo', 'distmd',
+    'mutext', 'legendtext', 'muaggatt', 'chorizon', 'cohydriccriteria',
+    'chpores', 'chaashto', 'coerosionacc', 'copm', 'comonth',
+    'muaoverlap', 'cotxfmother', 'mapunit', 'coeplants', 'laoverlap',
+    'cogeomordesc', 'codiagfeatures', 'cocanopycover'
+)
+# Excluded cointerp column sequences
+# interpll, interpllc, interplr, interplrc, interphh, interphhc
+exclude_i = frozenset({8, 9, 10, 11, 14, 15})
+# Rows of the month table
+months = (
+    (1, 'January'), (2, 'February'), (3, 'March'), (4, 'April'),
+    (5, 'May'), (6, 'June'), (7, 'July'), (8, 'August'),
+    (9, 'September'), (10, 'October'), (11, 'November'), (12, 'December')
+)
+# Read buffer (bytes) for the pipe delimited text files
+txt_buf = 1 << 20
+
 class xml:
     def __init__(self, aoi: str, path: str, gssurgo_v: str):
         self.path = path
@@ -139,48 +172,6 @@ def arcpyErr(func: str) -> str:
     except:
         return "Error in arcpyErr method"
 
-def funYield(
-        fn: Callable, iterSets: Tist, #[dict[str, Any]]
-        constSets: dict[str, Any]
-    ) : # -> Generator[list[int, str]]
-    """Iterativley calls a function as a generator
-
-    Parameters
-    ----------
-    fn : Callable
-        The function to be called as a generator
-    iterSets : Tist[dict[str, Any],]
-        These dictionaries are a set of dynmaic variables for each iteration. 
-        The keys must align with the ``fn`` parameters. The values the 
-        arguments for the function call.
-    constSets : dict[str, Any]
-        This dictionary is composed of the static variables sent as 
-        arguments to function call ``fn``. 
-        The keys must align with the ``fn`` parameters.
-
-    Yields
-    ------
-    Generator[int, str]
-        If successful, yields the value 0 and an empty string, otherwise
-        yields the value 2 with a string message. This generator can be
-        modified to yield the returned items from the function ``fn``.
-    """
-    try:
-        fn_inputs = iter(iterSets)
-        # initialize first set of processes
-        outputs = {
-            fn(**params, **constSets): params
-            for params in it.islice(fn_inputs, len(iterSets))
-        }
-        # output, params = outputs.popitem()
-        yield [0, '']
-
-    except:
-        arcpy.AddWarning('Better luck next time')
-        func = sys._getframe().f_code.co_name
-        msgs = pyErr(func)
-        yield [2, msgs]
-
 
 def createGDB(gdb_p: str, inputXML: xml) -> str:
     """Creates the SSURGO file geodatabase using an xml workspace file to 
@@ -212,7 +203,8 @@ def createGDB(gdb_p: str, inputXML: xml) -> str:
                          f"{outputFolder}\n")
 
         arcpy.management.CreateFileGDB(outputFolder, gdb_n)
-        if not arcpy.Exists(gdb_p):
+        # a file gdb is a directory, no need to open it as a workspace
+        if not os.path.isdir(gdb_p):
             arcpy.AddError("Failed to create new geodatabase")
             return False
         # The following command will fail when the user only has a Basic license
@@ -241,7 +233,7 @@ def createGDB(gdb_p: str, inputXML: xml) -> str:
 def importCoint( 
               input_p: str, 
               gdb_p: str, 
-              table_d: dict[list[str, str, list[tuple[int, str]]]],
+              table_d: dict[list[str, str, list[tuple[int, str]], tuple[str]]],
               ) -> str:
     """Runs through each SSURGO download folder and imports the rows into the 
     specified cointerp table . This table has unique information from each 
@@ -253,10 +245,11 @@ def importCoint(
         Path to the SSRUGO downloads
     gdb_p : str
         Path of the SSURGO geodatabase
-    table_d : dict[list[str, str, list[tuple[int, str]]]]
+    table_d : dict[list[str, str, list[tuple[int, str]], tuple[str]]]
         Key is the Table Physical Name (gdb table name). Value is a list with 
-        three elements, the text file base name, table label, and a list of 
-        tuples with the column sequence and column name.
+        four elements, the text file base name, table label, a list of 
+        tuples with the column sequence and column name, and a tuple of the
+        column names in sequence order.
 
     Returns
     -------
@@ -264,31 +257,36 @@ def importCoint(
         An empty string if successful, otherwise and error message.
     """
     try:
-        arcpy.env.workspace = gdb_p
         csv.field_size_limit(2147483647)
         table = 'cointerp'
         tab_p = f"{gdb_p}/{table}"
-        cols = table_d[table][2]
-        # get fields in sequence order
-        cols.sort()
-        fields = [f[1] for f in cols]
+        # fields in sequence order
+        fields = table_d[table][3]
         iCur = arcpy.da.InsertCursor(tab_p, fields)
         
         # Make file path for text file
         txt_p = f"{input_p}/cinterp.txt"
         if not os.path.exists(txt_p):
             return f"{txt_p} does not exist"
-        csvReader = csv.reader(
-            open(txt_p, 'r'), delimiter='|', quotechar='"'
-        )
-
-        for row in csvReader:
-            if row[1] == row[4] or row[1] == "54955":
-                # Slice out excluded elements
-                row = row[:7] + row[11:13] + row[15:]
-                # replace empty sets with None
-                iCur.insertRow(tuple(v or None for v in row))
-
+        # rows hold no reference cycles, skip cyclic gc while loading
+        gc_on = gc.isenabled()
+        gc.disable()
+        try:
+            with open(
+                txt_p, 'r', encoding='utf8', buffering=txt_buf, newline=''
+            ) as txt_f:
+                csvReader = csv.reader(txt_f, delimiter='|', quotechar='"')
+                insertRow = iCur.insertRow
+                for row in csvReader:
+                    if row[1] == row[4] or row[1] == "54955":
+                        # Slice out excluded elements
+                        row = row[:7] + row[11:13] + row[15:]
+                        # replace empty sets with None
+                        insertRow(tuple(v or None for v in row))
+        finally:
+            # leave gc as the host interpreter had it
+            if gc_on:
+                gc.enable()
         del csvReader, iCur
         arcpy.AddMessage(f"\tSuccessfully populated {table}")
         return 0 # None
@@ -322,12 +320,14 @@ def importCoint(
 def importList(
               input_p: str, 
               gdb_p: str, 
-              table_d: dict[list[str, str, list[tuple[int, str]]]],
-              table: str
+              table_d: dict[list[str, str, list[tuple[int, str]], tuple[str]]],
+              table: str,
+              unique: bool = False
               ) -> int:
     """Runs through the tabular folder and imports the rows into the 
     specified ``table`` . These tables have unique information from each 
-    survey area.
+    survey area, or are constant or largely common to all surveys, in which
+    case only the ``unique`` rows are inserted.
 
     Parameters
     ----------
@@ -335,43 +335,50 @@ def importList(
         Path to the SSRUGO downloads
     gdb_p : str
         Path of the SSURGO geodatabase
-    table_d : dict[list[str, str, list[tuple[int, str]]]]
+    table_d : dict[list[str, str, list[tuple[int, str]], tuple[str]]]
         Key is the Table Physical Name (gdb table name). Value is a list with 
-        three elements, the text file base name, table label, and a list of 
-        tuples with the column sequence and column name.
+        four elements, the text file base name, table label, a list of 
+        tuples with the column sequence and column name, and a tuple of the
+        column names in sequence order.
     table : str
         Table that is being imported.
+    unique : bool, optional
+        Insert only the distinct rows of the text file, by default False
 
     Returns
     -------
     int
-        An empty string if successful, otherwise and error message.
+        0 if successful, otherwise 1 or an error message.
     """
     try:
-        arcpy.env.workspace = gdb_p
         csv.field_size_limit(2147483647)
-        txt = table_d[table][0]
-        cols = table_d[table][2]
+        # text file and fields in sequence order
+        txt, _, _, fields = table_d[table]
         tab_p = f"{gdb_p}/{table}"
-        # get fields in sequence order
-        cols.sort()
-        fields = [f[1] for f in cols]
-        iCur = arcpy.da.InsertCursor(tab_p, fields)
-            # Make file path for text file
-        txt_p = f"'{input_p}/{txt}.txt'"
-        # in some instances // can create special charaters with eval
-        txt_p = txt_p.replace('\\', '/')
-        # convert latent f strings
-        txt_p = eval("f" + txt_p)
-        
+        # Make file path for text file
+        txt_p = f"{input_p}/{txt}.txt"
         if not os.path.exists(txt_p):
             return f"{txt_p} does not exist"
-        csvReader = csv.reader(
-            open(txt_p, 'r'), delimiter='|', quotechar='"'
-        )
-        for row in csvReader:
-            # replace empty sets with None
-            iCur.insertRow(tuple(v or None for v in row))
+        iCur = arcpy.da.InsertCursor(tab_p, fields)
+        # rows hold no reference cycles, skip cyclic gc while loading
+        gc_on = gc.isenabled()
+        gc.disable()
+        try:
+            with open(
+                txt_p, 'r', encoding='utf8', buffering=txt_buf, newline=''
+            ) as txt_f:
+                csvReader = csv.reader(txt_f, delimiter='|', quotechar='"')
+                # replace empty sets with None
+                rows = (tuple(v or None for v in row) for row in csvReader)
+                if unique:
+                    rows = set(rows)
+                insertRow = iCur.insertRow
+                for row in rows:
+                    insertRow(row)
+        finally:
+            # leave gc as the host interpreter had it
+            if gc_on:
+                gc.enable()
         del csvReader, iCur
         arcpy.AddMessage(f"\tSuccessfully populated {table}")
         return 0 # None
@@ -402,88 +409,6 @@ def importList(
         return 1 # pyErr(func)
 
 
-def importSet(
-              input_p: str, 
-              gdb_p: str, 
-              table_d: dict[str, list[str, str, list[tuple[int, str]]]]
-    ) -> str:
-    """Runs through the tabular folder and compiles a set of unique 
-    values to insert into respective tables. These tables are largely common 
-    to all surveys but some states have rows unique to their surveys.
-
-    Parameters
-    ----------
-    input_p : str
-        Path to the SSRUGO downloads
-    gdb_p : str
-        Path of the SSURGO geodatabase
-    table_d : dict[list[str, str, list[tuple[int, str]]]]
-        Key is the Table Physical Name (gdb table name). Value is a list with 
-        three elements, the text file base name, table label, and a list of 
-        tuples with the column sequence and column name.
-
-    Returns
-    -------
-    str
-        An empty string if successful, otherwise and error message.
-    """
-    try:
-        csv.field_size_limit(2147483647)
-        # 'distsubinterpmd'
-        tabs_l = ['distinterpmd', 'sdvattribute', 'sdvfolderattribute']
-        arcpy.env.workspace = gdb_p
-        
-        for table in tabs_l:
-            txt = table_d[table][0]
-            cols = table_d[table][2]
-            tab_p = f"{gdb_p}/{table}"
-            # get fields in sequence order
-            cols.sort()
-            fields = [f[1] for f in cols]
-            iCur = arcpy.da.InsertCursor(tab_p, fields)
-            row_s = set()
-            txt_p = f"{input_p}/{txt}.txt"
-            if not os.path.exists(txt_p):
-                return f"{txt_p} does not exist"
-            csvReader = csv.reader(
-                open(txt_p, 'r', encoding='utf8'), 
-                delimiter = '|', 
-                quotechar = '"'
-            )
-            for row in csvReader:
-                # replace empty sets with None
-                row_s.add(tuple(v or None for v in row))
-            for row in row_s:
-                iCur.insertRow(row)
-        del iCur
-        return ''
-
-    except arcpy.ExecuteError:
-        try:
-            del iCur
-        except:
-            pass
-        func = sys._getframe().f_code.co_name
-        return arcpy.AddError(arcpyErr(func))
-    except:
-        try:
-            arcpy.AddMessage(table)
-            # arcpy.AddMessage(cols)
-            # arcpy.AddMessage(txt)
-            # for i, e in enumerate(row):
-            #     if e:
-            #         size = len(e)
-            #     else:
-            #         size = 0
-                # arcpy.AddMessage(f"{fields[i]}: {size}")
-            del iCur
-        except:
-            pass
-        func = sys._getframe().f_code.co_name
-        return arcpy.AddError(pyErr(func))
-        
-        
-        
 def importSing(input_p: str, gdb_p: str) -> dict:
     """Import the tables that are common for each SSURGO download 
     Also creates a table dictionary that with the table information.
@@ -499,10 +424,10 @@ def importSing(input_p: str, gdb_p: str) -> dict:
     -------
     dict
         Key is the Table Physical Name (gdb table name). Value is a list with 
-        three elements, the text file base name, table label, and a list of 
-        tuples with the column sequence and column name. If the function 
-        returns in error the dictionary will return wiht the key 'Error' 
-        and a message.
+        four elements, the text file base name, table label, a list of 
+        tuples with the column sequence and column name, and a tuple of the
+        column names in sequence order. If the function returns in error 
+        the dictionary will return wiht the key 'Error' and a message.
     """
     try:
         # First read in mdstattabs: mstab table into 
@@ -512,73 +437,47 @@ def importSing(input_p: str, gdb_p: str) -> dict:
         # Then import the common tables
         tn = 69
         csv.field_size_limit(2147483647)
-        tabs_common = [
-            'mdstattabcols', 'mdstatrshipdet', 'mdstattabs', 'mdstatrshipmas',
-            'mdstatdommas', 'mdstatidxmas', 'mdstatidxdet',  'mdstatdomdet',
-            'sdvfolder', 'sdvalgorithm'
-        ]
 
-        arcpy.env.workspace = gdb_p
         txt_p = f"{input_p}/mstab.txt"
         if not os.path.exists(txt_p):
             table_d = {'Error': (f"{txt_p} does not exist", '', [])}
             return table_d
-        csvReader = csv.reader(
-            open(txt_p, 'r', encoding='utf8'), delimiter='|', quotechar='"'
-        )
-        
-        # dict{Table Physical Name: 
-        # [text file, Table Label, [(seq, column names)]]}
-        table_d = {t[0]: [t[4], t[2], []] for t in csvReader}
+        with open(txt_p, 'r', encoding='utf8', newline='') as txt_f:
+            csvReader = csv.reader(txt_f, delimiter='|', quotechar='"')
+            # dict{Table Physical Name: 
+            # [text file, Table Label, [(seq, column names)]]}
+            table_d = {t[0]: [t[4], t[2], []] for t in csvReader}
         # Retrieve column names
         txt_p = f"{input_p}/mstabcol.txt"
         if not os.path.exists(txt_p):
             table_d = {'Error': f"{txt_p} does not exist"}
             return table_d
-        csvReader = csv.reader(
-            open(txt_p, 'r', encoding='utf8'), delimiter='|', quotechar='"'
-        )
-        for row in csvReader:
-            table = row[0]
-            if table in table_d:
-                # add tuple with sequence (as int to sort) and column name
-                table_d[table][2].append((int(row[1]), row[2]))
-        
+        with open(txt_p, 'r', encoding='utf8', newline='') as txt_f:
+            csvReader = csv.reader(txt_f, delimiter='|', quotechar='"')
+            for table, seq, col, *_ in csvReader:
+                if table in table_d:
+                    # add tuple with sequence (as int to sort) and column name
+                    table_d[table][2].append((int(seq), col))
+        # Sort columns by sequence once and cache the ordered field names
+        for tab_l in table_d.values():
+            tab_l[2].sort()
+            tab_l.append(tuple(col[1] for col in tab_l[2]))
+
         # Populate static tables
         for table in tabs_common:
-            txt = table_d[table][0]
-            cols = table_d[table][2]
-            tab_p = f"{gdb_p}/{table}"
-            # get fields in sequence order
-            cols.sort()
-            fields = [f[1] for f in cols]
-
-            iCur = arcpy.da.InsertCursor(tab_p, fields)
-            txt_p = f"{input_p}/{txt}.txt"
-            if not os.path.exists(txt_p):
-                table_d = {'Error': f"{txt_p} does not exist"}
+            if (out := importList(input_p, gdb_p, table_d, table)):
+                if not isinstance(out, str):
+                    out = f"Failed to populate {table}"
+                table_d = {'Error': out}
                 return table_d
-            csvReader = csv.reader(
-                open(txt_p, 'r', encoding='utf8'), 
-                delimiter = '|', 
-                quotechar='"'
-            )
-            for row in csvReader:
-                # replace empty sets with None
-                iCur.insertRow(tuple(v or None for v in row))
-            del iCur
-            # Populate the month table
-            months = [
-                (1, 'January'), (2, 'February'), (3, 'March'), (4, 'April'),
-                (5, 'May'), (6, 'June'), (7, 'July'), (8, 'August'),
-                (9, 'September'), (10, 'October'), (11, 'November'),
-                (12, 'December')
-            ]
-            month_p = f"{gdb_p}/month"
-            iCur = arcpy.da.InsertCursor(month_p, ['monthseq', 'monthname'])
+
+        # Populate the month table
+        month_p = f"{gdb_p}/month"
+        with arcpy.da.InsertCursor(
+            month_p, ['monthseq', 'monthname']
+        ) as iCur:
             for month in months:
                 iCur.insertRow(month)
-            del iCur
 
         return table_d
 
@@ -640,26 +539,6 @@ def updateMetadata(gdb_p: str,
         gdb_n = os.path.basename(gdb_p)
         msgAppend = msg.append
 
-        states = {
-            'AK': 'Alaska', 'AL': 'Alabama', 'AR': 'Arkansas', 
-            'AS': 'American Samoa', 'AZ': 'Arizona', 'CA': 'California', 
-            'CO': 'Colorado', 'CT': 'Connecticut', 'DC': 'District of Columbia',
-            'DE': 'Delaware', 'FL': 'Florida', 'GA': 'Georgia', 'GU': 'Guam',
-            'HI': 'Hawaii', 'IA': 'Iowa', 'ID': 'Idaho', 'IL': 'Illinois',
-            'IN': 'Indiana', 'KS': 'Kansas', 'KY': 'Kentucky', 
-            'LA': 'Louisiana', 'MA': 'Massachusetts', 'MD': 'Maryland',
-            'ME': 'Maine', 'MI': 'Michigan', 'MN': 'Minnesota',
-            'MO': 'Missouri', 'MS': 'Mississippi', 'MT': 'Montana',
-            'NC': 'North Carolina', 'ND': 'North Dakota', 'NE': 'Nebraska',
-            'NH': 'New Hampshire', 'NJ': 'New Jersey', 'NM': 'New Mexico',
-            'NV': 'Nevada', 'NY': 'New York', 'OH': 'Ohio', 'OK': 'Oklahoma',
-            'OR': 'Oregon', 'PA': 'Pennsylvania',
-            'PRUSVI': "Puerto Rico and U.S. Virgin Islands",
-            'RI': 'Rhode Island', 'SC': 'South Carolina', 'SD': 'South Dakota',
-            'TN': 'Tennessee', 'TX': 'Texas', 'UT': 'Utah', 'VA': 'Virginia',
-            'VT': 'Vermont', 'WA': 'Washington', 'WI': 'Wisconsin',
-            'WV': 'West Virginia', 'WY': 'Wyoming'
-        }
         state = states[st]
         # initial metadata exported from current target featureclass
         meta_export = env.scratchFolder + f"/xxExport_{gdb_n}.xml"
@@ -680,70 +559,31 @@ def updateMetadata(gdb_p: str,
         tbl = gdb_p + "/SACATALOG"
         sqlClause = [None, "ORDER BY SAVEREST DESC"]
 
-        sCur = arcpy.da.SearchCursor(
+        # only the most recent date is needed, release cursor right away
+        with arcpy.da.SearchCursor(
             tbl, ['SAVEREST'], sql_clause = sqlClause
-        )
-        row = next(sCur)[0]
+        ) as sCur:
+            row = next(sCur)[0]
         lastDate = row.strftime('%Y%m%d')
-        del sCur
-        # Parse exported XML metadata file
-        # Convert XML to tree format
-        tree = ET.parse(meta_export)
-        root = tree.getroot()
-
-        # new citeInfo has title.text, edition.text, serinfo/issue.text
-        for child in root.findall('idinfo/citation/citeinfo/'):
-            if child.tag == "title":
-                if child.text.find('xxSTATExx') >= 0:
-                    child.text = child.text.replace('xxSTATExx', state)
-                if child.text.find('xxFYxx') >= 0:
-                    child.text = child.text.replace('xxFYxx', fy)
-                # elif place_str != "":
-                #     child.text = child.text + " - " + description
-            elif child.tag == "edition":
-                if child.text == 'xxFYxx':
-                    child.text = fy
-            elif child.tag == "serinfo":
-                for subchild in child.iter('issue'):
-                    if subchild.text == "xxFYxx":
-                        subchild.text = fy
-
-        # Update place keywords
-        ePlace = root.find('idinfo/keywords/place')
-        for child in ePlace.iter('placekey'):
-            if child.text == "xxSTATExx":
-                child.text = state
-            elif child.text == "xxSURVEYSxx":
-                child.text = survey_i
-
-        # Update credits
-        eIdInfo = root.find('idinfo')
-        for child in eIdInfo.iter('datacred'):
-            # sCreds = child.text
-            if child.text.find("xxSTATExx") >= 0:
-                child.text = child.text.replace("xxSTATExx", state)
-            if child.text.find("xxFYxx") >= 0:
-                child.text = child.text.replace("xxFYxx", fy)
-            if child.text.find("xxTODAYxx") >= 0:
-                child.text = child.text.replace("xxTODAYxx", lastDate)
-
-        # Update Summary
-        idDescrip = root.find('idinfo/descript')
-        for child in idDescrip.iter('purpose'):
-            if child.text.find("xxFYxx") >= 0:
-                child.text = child.text.replace("xxFYxx", fy)
-            if child.text.find("xxMONTHxx") >= 0:
-                child.text = child.text.replace("xxMONTHxx", month)
-            if child.text.find("xxSTATExx") >= 0:
-                child.text = child.text.replace("xxSTATExx", state)
-
-        procDates = root.find('dataqual/lineage')
-        if not procDates is None:
-            for child in procDates.iter('procdate'):
-                sDate = child.text
-                if sDate.find('xxTODAYxx'):
-                    child.text = lastDate
-        else:
+        # Placeholders in the citation, keywords, credits and summary
+        subs = {
+            'xxSTATExx': state, 'xxFYxx': fy, 'xxTODAYxx': lastDate,
+            'xxMONTHxx': month, 'xxSURVEYSxx': survey_i
+        }
+        subs_re = re.compile('|'.join(map(re.escape, subs)))
+        subsFun = lambda m: subs[m.group(0)]
+        # Parse exported XML metadata file, replacing placeholders as each
+        # element closes. The last element closed is the root.
+        for _, child in ET.iterparse(meta_export, events=('end',)):
+            # every process step is stamped with the latest survey date
+            if child.tag == 'procdate':
+                child.text = lastDate
+            elif (text := child.text) and 'xx' in text:
+                child.text = subs_re.sub(subsFun, text)
+        root = child
+        tree = ET.ElementTree(root)
+
+        if root.find('dataqual/lineage') is None:
             msgAppend("Process date not found")
 
         #  create new xml file which will be imported, 
@@ -815,8 +655,8 @@ def gSSURGO(input_p: str,
     It calls these functions to create and populate a SSURGO geodatabase: 
     1) ``CreateGDB`` to create a geodatabase using an xml template
     2) ``importSing`` imports tabels that are idential in each SSURGO folder.
-    3) ``importSet`` imports tabels that are largely indentical, with some
-    novelty.
+    3) ``importList`` with ``unique`` imports tabels that are largely 
+    indentical, with some novelty.
     4) ``importList`` imports tabels with unique information to each SSURGO
     dataset.
     5) ``createTableRelationships`` Establishes relationships between tables
@@ -874,85 +714,46 @@ def gSSURGO(input_p: str,
             arcpy.AddError(table_d['Error'])
             return
         arcpy.SetProgressorLabel("Importing table sets")
-        msg = importSet(input_p, gdb_p, table_d)
-        if msg:
-            arcpy.AddError(msg)
-            return
+        for table in tabs_set:
+            msg = importList(input_p, gdb_p, table_d, table, unique=True)
+            if msg:
+                if not isinstance(msg, str):
+                    msg = f"Failed to populate {table}"
+                arcpy.AddError(msg)
+                return
         # Tables which are unique to each SSURGO soil survey area
         arcpy.SetProgressorLabel("Importing unique tables")
-        tabs_uniq = [
-            'component', 'cosurfmorphhpp', 'legend', 'chunified','cocropyld',
-            'chtexturegrp', 'cosurfmorphss', 'coforprod', 'sacatalog',
-            'cosurfmorphgc', 'cotaxmoistcl', 'chtext', 'chconsistence',
-            'chtexture', 'copmgrp', 'cosoilmoist', 'mucropyld', 'chtexturemod',
-            'cotext', 'coecoclass', 'cosurfmorphmr', 'cosurffrags',
-            'cotreestomng', 'cosoiltemp', 'sainterp', 'chstructgrp',
-            'distlegendmd', 'copwindbreak', 'chdesgnsuffix', 'corestrictions',
-            'cotaxfmmin', 'chstruct', 'chfrags', 'coforprodo', 'distmd',
-            'mutext', 'legendtext', 'muaggatt', 'chorizon', 'cohydriccriteria',
-            'chpores', 'chaashto', 'coerosionacc', 'copm', 'comonth',
-            'muaoverlap', 'cotxfmother', 'mapunit', 'coeplants', 'laoverlap',
-            'cogeomordesc', 'codiagfeatures', 'cocanopycover'
-        ]
-        # Exclude these cointerp columns
-        # interpll, interpllc, interplr, interplrc, interphh, interphhc
-        exclude_i = {8, 9, 10, 11, 14, 15}
-        table_d['cointerp'][2] = [
-            cols for cols in table_d['cointerp'][2] if cols[0] not in exclude_i
-        ]
+        coi_l = table_d['cointerp']
+        coi_l[2] = [cols for cols in coi_l[2] if cols[0] not in exclude_i]
+        coi_l[3] = tuple(col[1] for col in coi_l[2])
         if gssurgo_v != '1.0':
-            tabs_uniq.remove('sainterp')
+            tabs = [tab for tab in tabs_uniq if tab != 'sainterp']
         # If light, exclude interp rules, except NCCPI
         else:
+            tabs = tabs_uniq
             co_out = importCoint(input_p, gdb_p, table_d)
             if co_out:
                 arcpy.AddError(co_out)
                 return False
 
-        # Create parameter dictionary with gdb table name and text file folder
-        paramSet = [
-            {'table': tab} for tab in tabs_uniq
-        ]
-
-        constSet = {
-            'input_p': input_p, 
-            'gdb_p': gdb_p, 
-            'table_d': table_d
-        }
-        # threadCount = 1 #psutil.cpu_count() // psutil.cpu_count(logical=False)
-        # arcpy.AddMessage(f"{threadCount= }")
-        ti = time.time()
-        import_jobs = funYield(importList, paramSet, constSet)
-        for paramBack, output in import_jobs:
-        # for paramBack in paramSet:
-            # output = importList(**paramBack, **constSet)
-            try:
-                # if not output:
-                    # arcpy.AddMessage(
-                        # f"\tSuccessfully populated {paramBack['table']}"
-                    # )
-                # else:
-                if output:
-                    # arcpy.AddError(f"Failed to populate {paramBack['table']}")
-                    arcpy.AddError(output)
-                    return
-            except GeneratorExit:
-                arcpy.AddWarning("passed")
-                arcpy.AddWarning(f"{paramBack}")
-                arcpy.AddWarning(f"{output}")
-                pass
-        import_jobs.close()
-        del import_jobs
+        # Import each table in turn, a file gdb takes a single writer so 
+        # concurrent InsertCursors would only contend for its lock
+        for table in tabs:
+            output = importList(input_p, gdb_p, table_d, table)
+            if output:
+                if not isinstance(output, str):
+                    output = f"Failed to populate {table}"
+                arcpy.AddError(output)
+                return
         gc.collect()
-        # arcpy.AddMessage(f"time: {time.time() - ti}")
 
         if not versionTab(input_p, gdb_p, gssurgo_v, v):
             arcpy.AddWarning('Version table failed to populate successfully.')
 
         if gssurgo_v != '1.0':
-            table_d['mdruleclass'] = ['NA', 'Rule Class Text Metadata', ()]
-            table_d['mdrule'] = ['NA', 'Interpretation Rules Metadata', ()]
-            table_d['mdinterp'] = ['NA', 'Interpretations Metadata', ()]
+            table_d['mdruleclass'] = ['NA', 'Rule Class Text Metadata', (), ()]
+            table_d['mdrule'] = ['NA', 'Interpretation Rules Metadata', (), ()]
+            table_d['mdinterp'] = ['NA', 'Interpretations Metadata', (), ()]
             msg = schemaChange(
                 gdb_p, input_p, module_p, table_d)
             # if msg:
@@ -977,15 +778,16 @@ def gSSURGO(input_p: str,
         tab_sac = f"{gdb_p}/sacatalog"
 
         # Areasymbol and Survey Area Version Established
-        sCur = arcpy.da.SearchCursor(tab_sac, ["AREASYMBOL", "SAVEREST"])
-        export_query = [
-            (f"{ssa} {date_obj.strftime(date_format)}", f"'{ssa}'")
-            for ssa, date_obj in sCur
-        ]
-        del sCur
         # survey_i format: NM007 (2022-09-08)
         # query_i format: 'NM007'
-        survey_i, query_i = map(','.join, zip(*export_query))
+        surveys = []
+        queries = []
+        with arcpy.da.SearchCursor(tab_sac, ["AREASYMBOL", "SAVEREST"]) as sCur:
+            for ssa, date_obj in sCur:
+                surveys.append(f"{ssa} {date_obj.strftime(date_format)}")
+                queries.append(f"'{ssa}'")
+        survey_i = ','.join(surveys)
+        query_i = ','.join(queries)
 
         # Update metadata for the geodatabase and all featureclasses
         arcpy.SetProgressorLabel("Updating metadata...")
@@ -1044,17 +846,22 @@ def createIndices(gdb_p: str, module_p: str, gssurgo_v: str) -> bool:
             csv_p = module_p + "/md_index_insert2.csv"
         else:
             csv_p = module_p + "/md_index_insert1.csv"
+        # Group indices by table so each table's indices are added together
+        # {table: [(column, index name, uniqueness)]}
+        idx_d = {}
         with open(csv_p, newline='', encoding='utf8') as csv_f:
             csv_r = csv.reader(csv_f, delimiter=',')
             hdr = next(csv_r)
             # Sequence, Unique, ascending are irrelavent in FGDB's
-            arcpy.SetProgressorLabel("Creating indexes")
             for tab_n, idx_n, seq, col_n, uk in csv_r:
-                if uk == 'Yes':
-                    un_b = "UNIQUE"
-                else:
-                    un_b = "NON_UNIQUE"
-                tab_p = f"{gdb_p}/{tab_n}"
+                un_b = "UNIQUE" if uk == 'Yes' else "NON_UNIQUE"
+                idx_d.setdefault(tab_n, []).append((col_n, idx_n, un_b))
+        arcpy.SetProgressorLabel("Creating indexes")
+        for tab_n, idx_l in idx_d.items():
+            tab_p = f"{gdb_p}/{tab_n}"
+            # non-unique first so a failed unique index is the last step
+            idx_l.sort(key=lambda idx: idx[2] == "UNIQUE")
+            for col_n, idx_n, un_b in idx_l:
                 arcpy.management.AddIndex(tab_p, col_n, idx_n, un_b)
         return True
     except arcpy.ExecuteError:
@@ -1068,7 +875,7 @@ def createIndices(gdb_p: str, module_p: str, gssurgo_v: str) -> bool:
         return False
 
 
-def createTableRelationships(gdb_p: str) -> str:
+def createTableRelationships(gdb_p: str) -> bool:
     """Creates the tabular relationships between the SSRUGO tables using arcpy
     CreateRelationshipClass function. These relationship classes are defined in 
     the mdstatrshipdet and mdstatrshipmas metadata tables. Note that the 
@@ -1082,8 +889,8 @@ def createTableRelationships(gdb_p: str) -> str:
 
     Returns
     -------
-    str
-        An empty string if successful, an error message if unsuccessful.
+    bool
+        Returns True if successful, otherwise False.
 
     """
     try:
@@ -1101,43 +908,42 @@ def createTableRelationships(gdb_p: str) -> str:
                 'ltabphyname', 'rtabphyname', 'ltabcolphyname', 'rtabcolphyname'
             ]
             # Create a set of all table to table relations in mdstatrshipmas
-            sCur = arcpy.da.SearchCursor(tbl1, flds1)
-            relSet = {(ltab, rtab) for ltab, rtab in sCur}
-            del sCur
+            with arcpy.da.SearchCursor(tbl1, flds1) as sCur:
+                relSet = set(sCur)
             # if table to table relationship defined in mdstatrshipmas, then 
-            # create relationship with column names from mdstatrshipdet
-            sCur = arcpy.da.SearchCursor(tbl2, flds2)
-            for ltab, rtab, lcol, rcol in sCur:
-                if (ltab, rtab) in relSet:
-                    # left table: Destination table
-                    # left column: Destination Foreign Key
-                    # right table: Origin Table
-                    # right column: Origin Primary Key
-                    rel_n = f"z_{ltab.lower()}_{rtab.lower()}"
-                    # create Forward Label i.e. "> Horizon AASHTO Table"
-                    fwdLabel = f"on {lcol}"
-                    # create Backward Label i.e. "< Horizon Table"
-                    backLabel = f"on {rcol}"
-                    arcpy.SetProgressorLabel(
-                        "Creating table relationship "
-                        f"between {ltab} and {rtab}"
-                    )
-                    arcpy.management.CreateRelationshipClass(
-                        f"{gdb_p}/{ltab}", f"{gdb_p}/{rtab}", rel_n, "SIMPLE",
-                        fwdLabel, backLabel, "NONE", "ONE_TO_MANY", "NONE",
-                        lcol, rcol
-                    )
-            del sCur
+            # create relationship with column names from mdstatrshipdet.
+            # Rows are read up front so no cursor is open on the gdb while
+            # relationship classes are created.
+            with arcpy.da.SearchCursor(tbl2, flds2) as sCur:
+                rel_l = [row for row in sCur if row[:2] in relSet]
+            for ltab, rtab, lcol, rcol in rel_l:
+                # left table: Destination table
+                # left column: Destination Foreign Key
+                # right table: Origin Table
+                # right column: Origin Primary Key
+                rel_n = f"z_{ltab.lower()}_{rtab.lower()}"
+                # create Forward Label i.e. "> Horizon AASHTO Table"
+                fwdLabel = f"on {lcol}"
+                # create Backward Label i.e. "< Horizon Table"
+                backLabel = f"on {rcol}"
+                arcpy.SetProgressorLabel(
+                    "Creating table relationship "
+                    f"between {ltab} and {rtab}"
+                )
+                arcpy.management.CreateRelationshipClass(
+                    f"{gdb_p}/{ltab}", f"{gdb_p}/{rtab}", rel_n, "SIMPLE",
+                    fwdLabel, backLabel, "NONE", "ONE_TO_MANY", "NONE",
+                    lcol, rcol
+                )
             
             return True
         else:
-            return("Missing mdstatrshipmas and/or mdstatrshipdet tables,"
-                   "relationship classes not created")
+            arcpy.AddError(
+                "Missing mdstatrshipmas and/or mdstatrshipdet tables, "
+                "relationship classes not created"
+            )
+            return False
     except arcpy.ExecuteError:
-        try:
-            del sCur
-        except:
-            pass
         arcpy.AddMessage(
             f"{gdb_p}/{rtab}, {gdb_p}/{ltab}, {rel_n}, SIMPLE, "
             f"{fwdLabel}, {backLabel}, NONE, ONE_TO_MANY, NONE, {rcol}, {lcol}"
@@ -1146,10 +952,6 @@ def createTableRelationships(gdb_p: str) -> str:
         arcpy.AddError(arcpyErr(func))
         return False
     except:
-        try:
-            del sCur
-        except:
-            pass
         arcpy.AddMessage(
             f"{gdb_p}/{rtab}, {gdb_p}/{ltab}, {rel_n}, SIMPLE, "
             f"{fwdLabel}, {backLabel}, NONE, ONE_TO_MANY, NONE, {rcol}, {lcol}"
@@ -1161,7 +963,7 @@ def createTableRelationships(gdb_p: str) -> str:
 
 def schemaChange(
         gdb_p: str, input_p: str, module_p: str, 
-        table_d: dict[str, list[str, str, list[tuple[int, str]]]], 
+        table_d: dict[str, list[str, str, list[tuple[int, str]], tuple[str]]], 
         ssa_l: list[str], light: bool
     ) -> bool:
     """This function reconciles differences in importing and schemas between 
@@ -1187,10 +989,11 @@ def schemaChange(
         Directory with the SSURGO datasets.
     module_p : str
         path to the sddt module
-    table_d : dict[str, list[str, str, list[tuple[int, str]]]]
+    table_d : dict[str, list[str, str, list[tuple[int, str]], tuple[str]]]
         Key is the Table Physical Name (gdb table name). Value is a list with 
-        three elements, the text file base name, table label, and a list of 
-        tuples with the column sequence and column name.
+        four elements, the text file base name, table label, a list of 
+        tuples with the column sequence and column name, and a tuple of the
+        column names in sequence order.
     ssa_l : list[str]
         List of SSURGO datasets to be imported.
     light : bool
@@ -1208,145 +1011,139 @@ def schemaChange(
         # Update mdstattabs table
         # Add mdinterp, mdrule, mdruleclass tables
         mdtab_p = gdb_p + "/mdstattabs"
-        mdtab_cols = table_d['mdstattabs'][2]
-        mdtab_cols.sort()
-        mdtab_cols = [col[1] for col in mdtab_cols]
-        iCur = arcpy.da.InsertCursor(mdtab_p, [mdtab_cols])
+        mdtab_cols = table_d['mdstattabs'][3]
         csv_p = module_p + "/md_tables_insert2.csv"
         with open(csv_p, newline='', encoding='utf8') as csv_f:
             csv_r = csv.reader(csv_f, delimiter=',')
             hdr = next(csv_r)
-            for row in csv_r:
-                iCur.insertRow(row)
-        del iCur
+            with arcpy.da.InsertCursor(mdtab_p, mdtab_cols) as iCur:
+                for row in csv_r:
+                    iCur.insertRow(row)
 
         # update mdstattabcols
         # update field lengths and/or datatype, i.e. make keys numeric
         mdcols_p = gdb_p + "/mdstattabcols"
-        mdcols_cols = table_d['mdstattabcols'][2]
-        mdcols_cols.sort()
-        mdcols_cols = [col[1] for col in mdcols_cols]
+        mdcols_cols = table_d['mdstattabcols'][3]
         csv_p = module_p + "/md_column_update2.csv"
         # collect list of column updates
         with open(csv_p, newline='', encoding='utf8') as csv_f:
             csv_r = csv.reader(csv_f, delimiter=',')
             hdr = next(csv_r)
-            # Table: Column: [type, length, sequence]
-            col_updates = {}
-            for row in csv_r:
-                if (table := row[0]) in col_updates:
-                    col_updates[table].update({row[1]: row[4:]})
-                else:
-                    col_updates[table] = {row[1]: row[4:]}
+            # (Table, Column): [type, length, sequence]
+            col_updates = {(row[0], row[1]): row[4:] for row in csv_r}
         # Update mdstattabcols table
-        uCur = arcpy.da.UpdateCursor(mdcols_p, mdcols_cols)
         d = 0
         u = 0
-        for col_row in uCur:
-            if (table := col_row[0]) in col_updates:
-                tab_updates = col_updates[table]
-                if (col := col_row[2]) in tab_updates:
-                    d_type, col_l, seq = tab_updates[col]
-                    if d_type.lower() != 'delete':
-                        # update sequence if updated
-                        col_row[1] = seq or col_row[1]
-                        # update data type
-                        col_row[5] = d_type
-                        # update length
-                        col_row[7] = col_l or None
-                        uCur.updateRow(col_row)
-                        tab_updates.pop(col)
-                        u += 1
-                    else:
-                        uCur.deleteRow()
-                        tab_updates.pop(col)
-                        d += 1
+        with arcpy.da.UpdateCursor(mdcols_p, mdcols_cols) as uCur:
+            for col_row in uCur:
+                col_k = (col_row[0], col_row[2])
+                if (col_update := col_updates.pop(col_k, None)) is None:
+                    continue
+                d_type, col_l, seq = col_update
+                if d_type.lower() != 'delete':
+                    # update sequence if updated
+                    col_row[1] = seq or col_row[1]
+                    # update data type
+                    col_row[5] = d_type
+                    # update length
+                    col_row[7] = col_l or None
+                    uCur.updateRow(col_row)
+                    u += 1
+                else:
+                    uCur.deleteRow()
+                    d += 1
         # arcpy.AddWarning(col_updates)
-        del uCur
 
         # Add new columns
         csv_p = module_p + "/md_column_insert2.csv"
         with open(csv_p, newline='', encoding='utf8') as csv_f:
             csv_r = csv.reader(csv_f, delimiter=',')
             hdr = next(csv_r)
-            iCur = arcpy.da.InsertCursor(mdcols_p, mdcols_cols)
-            for row in csv_r:
-                iCur.insertRow(tuple(v or None for v in row))
-        del iCur
+            with arcpy.da.InsertCursor(mdcols_p, mdcols_cols) as iCur:
+                for row in csv_r:
+                    iCur.insertRow(tuple(v or None for v in row))
 
         # Update mdstatidxmas and mdstatidxdet tables
         mdid_stat_p = gdb_p + '/mdstatidxmas'
-        mdid_stat_cols = table_d['mdstatidxmas'][2]
-        mdid_stat_cols.sort()
-        mdid_stat_cols  = [col[1] for col in mdid_stat_cols]
+        mdid_stat_cols = table_d['mdstatidxmas'][3]
         mdid_det_p = gdb_p + '/mdstatidxdet'
-        mdid_det_cols = table_d['mdstatidxdet'][2]
-        mdid_det_cols.sort()
-        mdid_det_cols  = [col[1] for col in mdid_det_cols]
+        mdid_det_cols = table_d['mdstatidxdet'][3]
         # delete obsolete indices
         csv_p = module_p + "/md_index_delete2.csv"
         with open(csv_p, newline='', encoding='utf8') as csv_f:
             csv_r = csv.reader(csv_f, delimiter=',')
             hdr = next(csv_r)
             idx_delete = {row[0]: row[1] for row in csv_r}
-        uCur = arcpy.da.UpdateCursor(mdid_stat_p, mdid_stat_cols[:2])
-        for table, col in uCur:
-            if table in idx_delete:
-                if idx_delete[table] == col:
-                    uCur.delteRow()
-        del uCur
-        uCur = arcpy.da.UpdateCursor(mdid_det_p, mdid_det_cols[:2])
-        for table, col in uCur:
-            if table in idx_delete:
-                if idx_delete[table] == col:
-                    uCur.delteRow()
-        del uCur
+        with arcpy.da.UpdateCursor(mdid_stat_p, mdid_stat_cols[:2]) as uCur:
+            for table, col in uCur:
+                if idx_delete.get(table) == col:
+                    uCur.deleteRow()
+        with arcpy.da.UpdateCursor(mdid_det_p, mdid_det_cols[:2]) as uCur:
+            for table, col in uCur:
+                if idx_delete.get(table) == col:
+                    uCur.deleteRow()
 
         # Insert new indices
-        iCur = arcpy.da.InsertCursor(mdid_stat_p, mdid_stat_cols)
         csv_p = module_p + "/md_index_insert2.csv"
+        idx_det_l = []
         with open(csv_p, newline='', encoding='utf8') as csv_f:
             csv_r = csv.reader(csv_f, delimiter=',')
             hdr = next(csv_r)
-            idx_det_l = []
-            for row in csv_r:
-                iCur.insertRow(row[:2] + [row[-1]])
-                idx_det_l.append(row[0:4])
-        del iCur
-        iCur = arcpy.da.InsertCursor(mdid_det_p, mdid_det_cols)
-        for row in idx_det_l:
-            iCur.insertRow(row)
-        del iCur
+            with arcpy.da.InsertCursor(mdid_stat_p, mdid_stat_cols) as iCur:
+                for row in csv_r:
+                    iCur.insertRow(row[:2] + [row[-1]])
+                    idx_det_l.append(row[0:4])
+        with arcpy.da.InsertCursor(mdid_det_p, mdid_det_cols) as iCur:
+            for row in idx_det_l:
+                iCur.insertRow(row)
 
         # Populate mdruleclass table
         # leave iCur open in case new interp classes found
         csv_p = module_p + "/md_rule_classes2.csv"
         crt_p = gdb_p + "/mdruleclass"
-        iCur = arcpy.da.InsertCursor(crt_p, ['classtxt', 'classkey'])
         # rule class text: class key
         class_d = {}
         with open(csv_p, newline='', encoding='utf8') as csv_f:
             csv_r = csv.reader(csv_f, delimiter=',')
             hdr = next(csv_r)
-            for class_txt, class_i in csv_r:
-                iCur.insertRow([class_txt, class_i])
-                class_d[class_txt] = class_i
-        class_sz = len(class_d)
-        del iCur
+            with arcpy.da.InsertCursor(
+                crt_p, ['classtxt', 'classkey']
+            ) as iCur:
+                for class_txt, class_k in csv_r:
+                    class_k = int(class_k)
+                    iCur.insertRow([class_txt, class_k])
+                    class_d[class_txt] = class_k
+        # new classes are keyed after the highest existing class key
+        class_i = max(class_d.values(), default=0)
         arcpy.AddMessage("\tSuccessfully populated mdruleclass")
 
         # Read cinterp.txt
             # exclude non-main rule cotinterps if light
             # except for NCCPI rules (main rule 54955)
+        # Tabular directory of each survey, checked for both text files 
+        # before either table is loaded
+        tab_dirs = [f"{input_p}/{ssa.upper()}/tabular" for ssa in ssa_l]
+        txts = (table_d['cointerp'][0], table_d['sainterp'][0])
+        missing = [
+            txt_p for tab_dir in tab_dirs for txt in txts
+            if not os.path.isfile(txt_p := f"{tab_dir}/{txt}.txt")
+        ]
+        if missing:
+            return "Missing text files:\n\t" + "\n\t".join(missing)
+
         arcpy.SetProgressorLabel("importing cointerp")
+        # Updated cointerp and sainterp columns in one query
+        # {tabphyname: [(colsequence, colphyname)]}
+        cols_d = {'cointerp': [], 'sainterp': []}
+        q = "tabphyname IN ('cointerp', 'sainterp')"
+        with arcpy.da.SearchCursor(
+            mdcols_p, ['tabphyname', 'colsequence', 'colphyname'], q
+        ) as sCur:
+            for tab, seq, col in sCur:
+                cols_d[tab].append((seq, col))
         co_tbl = 'cointerp'
-        q = "tabphyname = 'cointerp'"
-        sCur = arcpy.da.SearchCursor(mdcols_p, ['colsequence', 'colphyname'], q)
-        coi_cols = [row for row in sCur]
-        del sCur
         # get fields in sequence order
-        coi_cols.sort()
-        fields = [f[1] for f in coi_cols]
+        fields = [f[1] for f in sorted(cols_d[co_tbl])]
         txt = table_d[co_tbl][0]
         co_p = f"{gdb_p}/{co_tbl}"
         iCur = arcpy.da.InsertCursor(co_p, fields)
@@ -1354,79 +1151,82 @@ def schemaChange(
         # interpname: interpkey
         interp_d = {}
         # don't simultaneously populate mdrule as there is are many to one
-        # (interpkey, rulekey): [rulename, ruledepth, seq]
-        rule_d = {}
-        for ssa in ssa_l:
+        # (interpkey, rulekey) already seen
+        rule_s = set()
+        # (rulename, ruledepth, seq, interpkey, rulekey)
+        rule_l = []
+        # new rule classes, reported once cointerp is populated
+        new_classes = []
+        # local bindings for the row loop
+        classGet = class_d.get
+        newClass = new_classes.append
+        ruleSeen = rule_s.add
+        newRule = rule_l.append
+        insertRow = iCur.insertRow
+        strip = str.strip
+        # cinterp cells inserted into cointerp, pulled in one C call
+        # rating, class, 3 null categories, cokey, cointerpkey
+        getVals = itemgetter(11, 12, 15, 16, 17, 0, 18)
+        for tab_dir in tab_dirs:
             # Make file path for text file
-            txt_p = f"{input_p}/{ssa.upper()}/tabular/{txt}.txt"
-            if not os.path.exists(txt_p):
-                return f"{txt_p} does not exist"
-            csvReader = csv.reader(
-                open(txt_p, 'r', encoding='utf8'), delimiter='|', quotechar='"'
-            )
-            for row in csvReader:
-                # replace empty sets with None
-                row = [v or None for v in row]
-                interp_k = row[1]
-                rule_k = row[4]
-                # Add to new (rules, interps) to dict to populate mdrule table
-                if (interp_k, rule_k) not in rule_d:
-                    rule_d[(interp_k, rule_k)] = [
-                        *row[5:7], row[3]
-                    ]
-
-                # If its a rule not an interp, 
-                # the rule and interp keys (mrulekey) are not equal
-                if interp_k != rule_k:
-                    # An NCCPI rule (some SDV Attributes based on them)
-                    # OR not light (all rules included in cointerp)
-                    if (interp_k == '54955') or not light:
-                        class_txt = row[12]
-                        class_k = class_d.get(class_txt)
-                        # Possible that new classes come with new interps
-                        if not class_k:
-                            # increment class key
-                            class_i += 1
-                            class_k = class_i
-                            class_d[class_txt] = class_k
-                            arcpy.AddMessage(
-                                f"New rule class found: {class_txt}"
-                            )
-                        nulls = [v.strip() for v in row[15:18]]
-                        iCur.insertRow([
-                            row[11], class_k, *nulls, row[4], row[0],
-                            row[18]
-                        ])
-                # an interp
-                else:
-                    # Collect interps 
-                    if (rule_n := row[2]) not in interp_d:
-                        # Collect interp keys (main rule keys) by name to add to
-                        # sainterp and mdinterp tables
-                        interp_d[rule_n] = interp_k
-                    class_txt = row[12]
-                    class_k = class_d.get(class_txt)
+            txt_p = f"{tab_dir}/{txt}.txt"
+            with open(
+                txt_p, 'r', encoding='utf8', buffering=txt_buf, newline=''
+            ) as txt_f:
+                csvReader = csv.reader(txt_f, delimiter='|', quotechar='"')
+                for row in csvReader:
+                    # keys are always populated, only the cells that are
+                    # used have empty sets replaced with None
+                    interp_k = row[1]
+                    rule_k = row[4]
+                    # Add new (rules, interps) to dict to populate mdrule table
+                    if (rule_key := (interp_k, rule_k)) not in rule_s:
+                        ruleSeen(rule_key)
+                        newRule((
+                            row[5] or None, row[6] or None, row[3] or None,
+                            interp_k, rule_k
+                        ))
+
+                    # an interp, the rule and interp keys (mrulekey) are equal
+                    if interp_k == rule_k:
+                        # Collect interp keys (main rule keys) by name to add
+                        # to sainterp and mdinterp tables
+                        if (rule_n := row[2] or None) not in interp_d:
+                            interp_d[rule_n] = interp_k
+                    # a rule, only NCCPI rules (some SDV Attributes based on 
+                    # them) if light, otherwise all rules included in cointerp
+                    elif light and interp_k != '54955':
+                        continue
+                    rating, class_txt, n1, n2, n3, co_k, coi_k = getVals(row)
+                    # an empty class cell is a NULL classkey, not a class
+                    if not class_txt:
+                        class_k = None
                     # Possible that new classes come with new interps
-                    if not class_k:
+                    elif not (class_k := classGet(class_txt)):
                         # increment class key
                         class_i += 1
                         class_k = class_i
                         class_d[class_txt] = class_k
-                        arcpy.AddMessage(f"New rule class found: {class_txt}")
+                        newClass(class_txt)
                     # some zeros have a space after them
-                    nulls = [v.strip() for v in row[15:18]]
-                    iCur.insertRow([
-                        row[11], class_k, *nulls, rule_k, row[0], row[18]
-                    ])
+                    insertRow((
+                        rating or None, class_k, strip(n1) or None,
+                        strip(n2) or None, strip(n3) or None, rule_k,
+                        co_k or None, coi_k or None
+                    ))
         arcpy.AddMessage("\tSuccessfully populated cointerp")
         del iCur
         # insert any new found interp classes
-        if len(class_d) != class_sz:
-            arcpy.AddMessage(f"Adding {len(class_d)} new interp classes")
-            iCur = arcpy.da.InsertCursor(crt_p, ['classtxt', 'classkey'])
-            for class_txt, class_k in class_d:
-                iCur.insertRow([class_txt, class_k])
-            del iCur
+        if new_classes:
+            arcpy.AddMessage(
+                "New rule classes found:\n\t" + "\n\t".join(new_classes)
+            )
+            arcpy.AddMessage(f"Adding {len(new_classes)} new interp classes")
+            with arcpy.da.InsertCursor(
+                crt_p, ['classtxt', 'classkey']
+            ) as iCur:
+                for class_txt in new_classes:
+                    iCur.insertRow((class_txt, class_d[class_txt]))
         # Delete rulekey if light
 
         # Populate mdrule table
@@ -1434,44 +1234,37 @@ def schemaChange(
         fields = [
             'rulename', 'ruledepth', 'seqnum', 'interpkey', 'rulekey'
         ]
-        iCur = arcpy.da.InsertCursor(mdr_p, fields)
-        for k, v in rule_d.items():
-            # [rulename, ruledepth, seq], [interpkey, rulekey]
-            iCur.insertRow([*v, *k])
-        del iCur
+        if rule_l:
+            with arcpy.da.InsertCursor(mdr_p, fields) as iCur:
+                for rule_row in rule_l:
+                    iCur.insertRow(rule_row)
         arcpy.AddMessage("\tSuccessfully populated mdrule")
 
         # Sainterp table
         sa_tbl = 'sainterp'
-        q = "tabphyname = 'sainterp'"
-        sCur = arcpy.da.SearchCursor(mdcols_p, ['colsequence', 'colphyname'], q)
-        sa_cols = [row for row in sCur]
-        del sCur
         # get fields in sequence order
-        sa_cols.sort()
-        fields = [f[1] for f in sa_cols]
+        fields = [f[1] for f in sorted(cols_d[sa_tbl])]
         txt = table_d[sa_tbl][0]
         sa_p = f"{gdb_p}/{sa_tbl}"
         iCur = arcpy.da.InsertCursor(sa_p, fields)
         # interp key: first 7 elements from sintperp
         mdinterp_d = {}
-        for ssa in ssa_l:
+        for tab_dir in tab_dirs:
             # Make file path for text file
-            txt_p = f"{input_p}/{ssa.upper()}/tabular/{txt}.txt"
-            if not os.path.exists(txt_p):
-                return f"{txt_p} does not exist"
-            csvReader = csv.reader(
-                open(txt_p, 'r', encoding='utf8'), delimiter='|', quotechar='"'
-            )
-            for row in csvReader:
-                # replace empty sets with None
-                row = tuple(v or None for v in row)
-                interp_n = row[1]
-                interp_k = interp_d.get(interp_n)
-                if interp_k not in mdinterp_d:
-                    # Get interp info to populate mdinterp
-                    mdinterp_d[interp_k] = row[1:7]
-                iCur.insertRow([interp_k, *row[-2:]])
+            txt_p = f"{tab_dir}/{txt}.txt"
+            with open(
+                txt_p, 'r', encoding='utf8', buffering=txt_buf, newline=''
+            ) as txt_f:
+                csvReader = csv.reader(txt_f, delimiter='|', quotechar='"')
+                for row in csvReader:
+                    # replace empty sets with None
+                    row = tuple(v or None for v in row)
+                    interp_n = row[1]
+                    interp_k = interp_d.get(interp_n)
+                    if interp_k not in mdinterp_d:
+                        # Get interp info to populate mdinterp
+                        mdinterp_d[interp_k] = row[1:7]
+                    iCur.insertRow([interp_k, *row[-2:]])
         del iCur
         arcpy.AddMessage("\tSuccessfully populated sainterp")
 
@@ -1481,10 +1274,9 @@ def schemaChange(
             'interpname', 'interptype', 'interpdesc', 'interpdesigndate',
             'interpgendate', 'interpmaxreasons', 'interpkey'
         ]
-        iCur = arcpy.da.InsertCursor(mdi_p, fields)
-        for k, vals in mdinterp_d.items():
-            iCur.insertRow([*vals, k])
-        del iCur
+        with arcpy.da.InsertCursor(mdi_p, fields) as iCur:
+            for k, vals in mdinterp_d.items():
+                iCur.insertRow([*vals, k])
         arcpy.AddMessage("\tSuccessfully populated mdinterp")
         return True
 
@@ -1493,10 +1285,6 @@ def schemaChange(
             del iCur
         except:
             pass
-        try:
-            del uCur
-        except:
-            pass
         func = sys._getframe().f_code.co_name
         arcpy.AddError(arcpyErr(func))
         return False
@@ -1505,10 +1293,6 @@ def schemaChange(
             del iCur
         except:
             pass
-        try:
-            del uCur
-        except:
-            pass
         func = sys._getframe().f_code.co_name
         arcpy.AddError(pyErr(func))
         return False
@@ -1537,15 +1321,13 @@ def versionTab(input_p: str, gdb_p: str, gssurgo_v: str, script_v: str) -> bool:
     """
     try:
             # populate version table
-        txt_p = f"{input_p}/ersion.txt"
+        txt_p = f"{input_p}/version.txt"
         if not os.path.exists(txt_p):
             ssurgo_v = 'NA'
         else:
-            csvReader = csv.reader(
-                open(txt_p, 'r', encoding='utf8'), delimiter='|', quotechar='"'
-            )
-            ssurgo_v = next(csvReader)[0]
-            del csvReader
+            with open(txt_p, 'r', encoding='utf8', newline='') as txt_f:
+                csvReader = csv.reader(txt_f, delimiter='|', quotechar='"')
+                ssurgo_v = next(csvReader)[0]
         esri_i = arcpy.GetInstallInfo()
         # File Geodatabase version
         # https://pro.arcgis.com/en/pro-app/latest/arcpy/functions/
@@ -1577,10 +1359,11 @@ def versionTab(input_p: str, gdb_p: str, gssurgo_v: str, script_v: str) -> bool:
         version_d['abbrev1'] = ('Abbreviation Level', 'cointerp', '0.5')
 
         version_p = f"{gdb_p}/version"
-        iCur = arcpy.da.InsertCursor(version_p, ['type', 'name', 'version'])
-        for vals in version_d.values():
-            iCur.insertRow([*vals])
-        del iCur
+        with arcpy.da.InsertCursor(
+            version_p, ['type', 'name', 'version']
+        ) as iCur:
+            for vals in version_d.values():
+                iCur.insertRow([*vals])
         arcpy.AddMessage("\tSuccessfully populated version")
         return True
     
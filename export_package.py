@@ -34,6 +34,29 @@ import os
 import sys
 import traceback
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+# Text files copied from the tabular folder into the export package
+tabs_req = frozenset({
+    'ccancov.txt', 'ccrpyd.txt', 'cdfeat.txt', 'cecoclas.txt',
+    'ceplants.txt', 'cerosnac.txt', 'cfprod.txt', 'cfprodo.txt',
+    'cgeomord.txt', 'chaashto.txt', 'chconsis.txt', 'chdsuffx.txt',
+    'chfrags.txt', 'chorizon.txt', 'chpores.txt', 'chstr.txt',
+    'chstrgrp.txt', 'chtexgrp.txt', 'chtexmod.txt', 'chtext.txt',
+    'chtextur.txt', 'chunifie.txt', 'chydcrit.txt', 'cinterp.txt',
+    'cmonth.txt', 'comp.txt', 'cpmat.txt', 'cpmatgrp.txt',
+    'cpwndbrk.txt', 'crstrcts.txt', 'csfrags.txt', 'csmoist.txt',
+    'csmorgc.txt', 'csmorhpp.txt', 'csmormr.txt', 'csmorss.txt',
+    'cstemp.txt', 'ctext.txt', 'ctreestm.txt', 'ctxfmmin.txt',
+    'ctxfmoth.txt', 'ctxmoicl.txt', 'distimd.txt', 'distlmd.txt',
+    'distmd.txt', 'lareao.txt', 'legend.txt', 'ltext.txt',
+    'mapunit.txt', 'msdomdet.txt', 'msdommas.txt', 'msidxdet.txt',
+    'msidxmas.txt', 'msrsdet.txt', 'msrsmas.txt', 'mstab.txt',
+    'mstabcol.txt', 'muaggatt.txt', 'muareao.txt', 'mucrpyd.txt',
+    'mutext.txt', 'sacatlog.txt', 'sainterp.txt', 'sdvalgorithm.txt',
+    'sdvattribute.txt', 'sdvfolder.txt', 'sdvfolderattribute.txt',
+    'version.txt'
+})
 
 
 def pyErr(func: str = None) -> str:
@@ -120,53 +143,39 @@ def main(args: list[str, str, str, int, str]) ->str:
         # Make export directory
         out_p = os.path.dirname(gdb_p)
         export_p = f"{out_p}/RSS_{st}"
-        os.mkdir(export_p)
-        # Add spatial and taubular sub directories
-        dirs = ['spatial', 'tabular']
-        for d in dirs:
-            os.mkdir(f"{export_p}/{d}")
+        # Add spatial and taubular sub directories, a rerun reuses them
+        spatial_p = f"{export_p}/spatial"
+        tab_out = f"{export_p}/tabular"
+        os.makedirs(spatial_p, exist_ok=True)
+        os.makedirs(tab_out, exist_ok=True)
 
         # Export MURASTER as tif
-        out_r = f"{export_p}/spatial/{raster_n}.tif"
+        out_r = f"{spatial_p}/{raster_n}.tif"
         arcpy.management.CopyRaster(
             f"{gdb_p}/{raster_n}", out_r, None, None, None, None, None, 
             "32_BIT_UNSIGNED"
         )
 
         # Copy over tabular textfiles from source
-        tab_out = f"{export_p}/tabular"
-        tabs_req = [
-            'ccancov.txt', 'ccrpyd.txt', 'cdfeat.txt', 'cecoclas.txt',
-            'ceplants.txt', 'cerosnac.txt', 'cfprod.txt', 'cfprodo.txt',
-            'cgeomord.txt', 'chaashto.txt', 'chconsis.txt', 'chdsuffx.txt',
-            'chfrags.txt', 'chorizon.txt', 'chpores.txt', 'chstr.txt',
-            'chstrgrp.txt', 'chtexgrp.txt', 'chtexmod.txt', 'chtext.txt',
-            'chtextur.txt', 'chunifie.txt', 'chydcrit.txt', 'cinterp.txt',
-            'cmonth.txt', 'comp.txt', 'cpmat.txt', 'cpmatgrp.txt',
-            'cpwndbrk.txt', 'crstrcts.txt', 'csfrags.txt', 'csmoist.txt',
-            'csmorgc.txt', 'csmorhpp.txt', 'csmormr.txt', 'csmorss.txt',
-            'cstemp.txt', 'ctext.txt', 'ctreestm.txt', 'ctxfmmin.txt',
-            'ctxfmoth.txt', 'ctxmoicl.txt', 'distimd.txt', 'distlmd.txt',
-            'distmd.txt', 'lareao.txt', 'legend.txt', 'ltext.txt',
-            'mapunit.txt', 'msdomdet.txt', 'msdommas.txt', 'msidxdet.txt',
-            'msidxmas.txt', 'msrsdet.txt', 'msrsmas.txt', 'mstab.txt',
-            'mstabcol.txt', 'muaggatt.txt', 'muareao.txt', 'mucrpyd.txt',
-            'mutext.txt', 'sacatlog.txt', 'sainterp.txt', 'sdvalgorithm.txt',
-            'sdvattribute.txt', 'sdvfolder.txt', 'sdvfolderattribute.txt',
-            'version.txt'
-        ]
-
-        in_contents = os.listdir(input_p)
-        for f in os.scandir(input_p):
-            if f.is_file() and f.name in in_contents:
-                shutil.copy(f.path, f"{tab_out}/{f.name}")
-                tabs_req.remove(f.name)
-        if tabs_req:
+        # Collect the names of the required files present, closing the
+        # directory handle before any copying starts. Name test first,
+        # is_file only for the required names
+        with os.scandir(input_p) as entries:
+            to_copy = {
+                f.name for f in entries if f.name in tabs_req and f.is_file()
+            }
+        # Copies are independent and I/O bound, overlap them in threads
+        src_l = [f"{input_p}/{t}" for t in to_copy]
+        dst_l = [f"{tab_out}/{t}" for t in to_copy]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(shutil.copyfile, src_l, dst_l))
+        # required text files not copied
+        missing = tabs_req - to_copy
+        if missing:
             arcpy.AddWarning(
                 f"\tThe following text files were not copied over to {tab_out}:"
+                + "".join(f"\n\t\t{t}" for t in sorted(missing))
                 )
-            for t in tabs_req:
-                arcpy.AddWarning(f"\t\t{t}")
         return export_p
 
     except arcpy.ExecuteError:
@@ -35,8 +35,37 @@ import os
 import traceback
 import datetime
 import platform
+import re
+from operator import itemgetter
 from arcpy import env
-import xml.etree.cElementTree as ET
+import xml.etree.ElementTree as ET
+
+# State and territory names by abbreviation, used in raster metadata
+states = {
+    'AK': 'Alaska', 'AL': 'Alabama', 'AR': 'Arkansas',
+    'AS': 'American Samoa', 'AZ': 'Arizona', 'CA': 'California',
+    'CO': 'Colorado', 'CT': 'Connecticut', 
+    'DC': 'District of Columbia', 'DE': 'Delaware', 'FL': 'Florida',
+    'FM': 'Federated States of Micronesia', 'GA': 'Georgia',
+    'GU': 'Guam', 'HI': 'Hawaii', 'IA': 'Iowa', 'ID': 'Idaho',
+    'IL': 'Illinois', 'IN': 'Indiana', 'KS': 'Kansas',
+    'KY': 'Kentucky', 'LA': 'Louisiana', 'MA': 'Massachusetts',
+    'MD': 'Maryland', 'ME': 'Maine', 
+    'MH': 'Republic of the Marshall Islands', 'MI': 'Michigan',
+    'MN': 'Minnesota', 'MO': 'Missouri',
+    'MP': 'Commonwealth of the Northern Mariana Islands',
+    'MS': 'Mississippi', 'MT': 'Montana', 'NC': 'North Carolina',
+    'ND': 'North Dakota', 'NE': 'Nebraska', 'NH': 'New Hampshire',
+    'NJ': 'New Jersey', 'NM': 'New Mexico', 'NV': 'Nevada',
+    'NY': 'New York', 'OH': 'Ohio', 'OK': 'Oklahoma',
+    'OR': 'Oregon', 'PA': 'Pennsylvania', 'PR': 'Puerto Rico',
+    'PW': 'Republic of Palau', 'RI': 'Rhode Island',
+    'SC': 'South Carolina', 'SD': 'South Dakota', 'TN': 'Tennessee',
+    'TX': 'Texas', 'UT': 'Utah', 'VA': 'Virginia', 
+    'VI': 'U.S. Virgin Islands', 'VT': 'Vermont',
+    'WA': 'Washington', 'WI': 'Wisconsin', 'WV': 'West Virginia',
+    'WY': 'Wyoming'
+}
 
 
 def pyErr(func: str = None) -> str:
@@ -112,10 +141,9 @@ resolution equals new extent coordinate component.
     """
 
     try:
-        coord = coord + offset
-        coord_n = (
-            coord // cell_r + round((coord % cell_r) / cell_r)
-        ) * cell_r
+        # quotient and remainder from a single division
+        q, r = divmod(coord + offset, cell_r)
+        coord_n = (q + round(r / cell_r)) * cell_r
         return coord_n - offset
 
     except:
@@ -172,40 +200,15 @@ def UpdateMetadata(
         if os.path.isfile(meta_import):
             os.remove(meta_import)
 
-        states = {
-                'AK': 'Alaska', 'AL': 'Alabama', 'AR': 'Arkansas',
-                'AS': 'American Samoa', 'AZ': 'Arizona', 'CA': 'California',
-                'CO': 'Colorado', 'CT': 'Connecticut', 
-                'DC': 'District of Columbia', 'DE': 'Delaware', 'FL': 'Florida',
-                'FM': 'Federated States of Micronesia', 'GA': 'Georgia',
-                'GU': 'Guam', 'HI': 'Hawaii', 'IA': 'Iowa', 'ID': 'Idaho',
-                'IL': 'Illinois', 'IN': 'Indiana', 'KS': 'Kansas',
-                'KY': 'Kentucky', 'LA': 'Louisiana', 'MA': 'Massachusetts',
-                'MD': 'Maryland', 'ME': 'Maine', 
-                'MH': 'Republic of the Marshall Islands', 'MI': 'Michigan',
-                'MN': 'Minnesota', 'MO': 'Missouri',
-                'MP': 'Commonwealth of the Northern Mariana Islands',
-                'MS': 'Mississippi', 'MT': 'Montana', 'NC': 'North Carolina',
-                'ND': 'North Dakota', 'NE': 'Nebraska', 'NH': 'New Hampshire',
-                'NJ': 'New Jersey', 'NM': 'New Mexico', 'NV': 'Nevada',
-                'NY': 'New York', 'OH': 'Ohio', 'OK': 'Oklahoma',
-                'OR': 'Oregon', 'PA': 'Pennsylvania', 'PR': 'Puerto Rico',
-                'PW': 'Republic of Palau', 'RI': 'Rhode Island',
-                'SC': 'South Carolina', 'SD': 'South Dakota', 'TN': 'Tennessee',
-                'TX': 'Texas', 'UT': 'Utah', 'VA': 'Virginia', 
-                'VI': 'U.S. Virgin Islands', 'VT': 'Vermont',
-                'WA': 'Washington', 'WI': 'Wisconsin', 'WV': 'West Virginia',
-                'WY': 'Wyoming'
-            }
         state = states[st]
 
         sacat_p = f"{wksp}/sacatalog"
         with arcpy.da.SearchCursor(
-            sacat_p, ("AREASYMBOL") #, "SAVEREST")
+            sacat_p, ["AREASYMBOL"], #, "SAVEREST"]
+            sql_clause=(None, "ORDER BY AREASYMBOL")
             ) as sCur:
             # f"{rec[0]} ({str(rec[1]).split()[0]})"
-            exp_l = [rec[0] for rec in sCur]
-        survey_i = ", ".join(exp_l)
+            survey_i = ", ".join(map(itemgetter(0), sCur))
 
         # System Environment
         esri_i = arcpy.GetInstallInfo()
@@ -234,125 +237,36 @@ def UpdateMetadata(
         # As of July 2020, switch gSSURGO version format to YYYYMM
         fy = d.strftime('%Y%m')
 
-        # Process gSSURGO_MapunitRaster.xml from script directory
-        tree = ET.parse(meta_export)
-        root = tree.getroot()
-
-        # new citeInfo has title.text, edition.text, serinfo/issue.text
-        citeinfo = root.findall('idinfo/citation/citeinfo/')
-        if citeinfo is not None:
-            # Process citation elements
-            # title, edition, issue
-            for child in citeinfo:
-                if child.tag == "title":
-                    newTitle = f"Map Unit Raster {resolution} {state}"
-                    child.text = newTitle
-                elif child.tag == "edition":
-                    if child.text == 'xxFYxx':
-                        child.text = fy
-                elif child.tag == "serinfo":
-                    for subchild in child.iter('issue'):
-                        if subchild.text == "xxFYxx":
-                            subchild.text = fy
-
-        # Update place keywords
-        place = root.find('idinfo/keywords/place')
-        if place is not None:
-            for child in place.iter('placekey'):
-                if child.text == "xxSTATExx":
-                    child.text = state
-                elif child.text == "xxSURVEYSxx":
-                    child.text = survey_i
-
-        # Update credits
-        idinfo = root.find('idinfo')
-        if idinfo is not None:
-            for child in idinfo.iter('datacred'):
-                text = child.text
-                if text.find("xxSTATExx") >= 0:
-                    text = text.replace("xxSTATExx", state)
-                if text.find("xxFYxx") >= 0:
-                    text = text.replace("xxFYxx", fy)
-                if text.find("xxTODAYxx") >= 0:
-                    text = text.replace("xxTODAYxx", today)
-                child.text = text
-
-        purpose = root.find('idinfo/descript/purpose')
-        if purpose is not None:
-            text = purpose.text
-            if text.find("xxFYxx") >= 0:
-                purpose.text = text.replace("xxFYxx", fy)
-
-        # Update process steps
-        procstep = root.findall('dataqual/lineage/procstep')
-        if procstep:
-            for child in procstep:
-                for subchild in child.iter('procdesc'):
-                    text = subchild.text
-                    if text.find('xxTODAYxx') >= 0:
-                        text = text.replace("xxTODAYxx", d.strftime('%Y-%m-%d'))
-                    if text.find("xxSTATExx") >= 0:
-                        text = text.replace("xxSTATExx", state)
-                    if text.find("xxFYxx") >= 0:
-                        text = text.replace("xxFYxx", fy)
-                    if text.find("xxRESxx") >= 0:
-                        text = text.replace('xxRESxx', resolution)
-                    if text.find("xxDBxx") >= 0:
-                        text = text.replace('xxDBxx', db)
-                    if text.find("xxTOOLxx") >= 0:
-                        text = text.replace('xxTOOLxx', tool)
-                    subchild.text = text
-
-        # Update VAT name
-        enttypl = root.find('eainfo/detailed/enttyp/enttypl')
-        if enttypl is not None:
-            text = enttypl.text
-            if text.find("xxNAMExx") >= 0:
-                enttypl.text = text.replace(
-                    "xxNAMExx", os.path.basename(target))
-
-        # Update OS, ESRI, Python system information
-        native = root.find('idinfo/native')
-        if native is not None:
-            text = native.text
-            if text == "xxENVxx":
-                native.text = sys_env
-        envirDesc = root.find('dataIdInfo/envirDesc')
-        if envirDesc is not None:
-            text = envirDesc.text
-            if text == "xxENVxx":
-                envirDesc.text = sys_env
-
-        # update raster resoluton
-        stepDesc = root.find('dqInfo/dataLineage/prcStep/stepDesc')
-        if stepDesc is not None:
-            text = stepDesc.text
-            if text.find('xxRESxx') >= 0:
-                text = text.replace('xxRESxx', resolution)
-            if text.find("xxDBxx") >= 0:
-                text = text.replace('xxDBxx', db)
-            if text.find("xxTOOLxx") >= 0:
-                text = text.replace('xxTOOLxx', tool)
-            stepDesc.text = text
-
-        # Update database information
-        formname = root.find('distinfo/stdorder/digform/digtinfo/formname')
-        if formname is not None:
-            if formname.text == "xxDBxx":
-                formname.text = db
-        formvern = root.find('distinfo/stdorder/digform/digtinfo/formvern')
-        if formvern is not None:
-            if formvern.text == "xxVERxx":
-                formvern.text = ver
-
-        formatName = root.find('distInfo/distributor/distorFormat/formatName')
-        if formatName is not None:
-            if formatName.text == "xxDBxx":
-                formatName.text = db
-        formatVer = root.find('distInfo/distributor/distorFormat/formatVer')
-        if formatVer is not None:
-            if formatVer.text == "xxVERxx":
-                formatVer.text = ver
+        # Placeholders replaced wherever they occur in the template, FGDC 
+        # and ISO sections alike, in a single walk of the tree
+        subs = {
+            'xxSTATExx': state, 'xxSURVEYSxx': survey_i, 'xxFYxx': fy,
+            'xxTODAYxx': today, 'xxRESxx': resolution, 'xxDBxx': db,
+            'xxTOOLxx': tool, 'xxVERxx': ver,
+            'xxNAMExx': os.path.basename(target), 'xxENVxx': sys_env
+        }
+        # process step descriptions give today's date as yyyy-mm-dd
+        proc_subs = {**subs, 'xxTODAYxx': d.strftime('%Y-%m-%d')}
+        subs_re = re.compile('|'.join(map(re.escape, subs)))
+        subsFun = lambda m: subs[m.group(0)]
+        procFun = lambda m: proc_subs[m.group(0)]
+        # citation titles are replaced outright
+        titles = {'title', 'resTitle'}
+        newTitle = f"Map Unit Raster {resolution} {state}"
+        # Process RSS_ClassRaster.xml from script directory, replacing
+        # placeholders as each element closes. The last element closed is
+        # the root.
+        for _, child in ET.iterparse(meta_export, events=('end',)):
+            if not (text := child.text) or 'xx' not in text:
+                continue
+            if child.tag in titles:
+                child.text = newTitle
+            else:
+                child.text = subs_re.sub(
+                    procFun if child.tag == 'procdesc' else subsFun, text
+                )
+        root = child
+        tree = ET.ElementTree(root)
 
         #  create new xml file which will be imported, 
         # thereby updating the table's metadata
@@ -450,6 +364,20 @@ def main(args: list[str, str, str, int, str]) ->str:
         rast_lry = extCoord(rast_lr.Y, cell_r, 5)
         rast_ulx = extCoord(rast_ul.X, cell_r, 5)
         rast_uly = extCoord(rast_ul.Y, cell_r, 5)
+        # input already 10 m unsigned 32 bit, snapped and in a geodatabase
+        aligned = (
+            not project
+            and rast_d.pixelType == 'U32'
+            and os.path.splitext(rast_d.path)[1] == '.gdb'
+            and all(
+                abs(a - b) < 1e-6 for a, b in zip(
+                    (rast_d.meanCellWidth, rast_d.meanCellHeight,
+                     rast_ulx, rast_uly, rast_lrx, rast_lry),
+                    (cell_r, cell_r,
+                     rast_ul.X, rast_ul.Y, rast_lr.X, rast_lr.Y)
+                )
+            )
+        )
         rast_ext = arcpy.Extent(rast_ulx, rast_lry, rast_lrx, rast_uly)
         # Set environment to new extent.
         env.extent = rast_ext
@@ -485,6 +413,9 @@ def main(args: list[str, str, str, int, str]) ->str:
                 mem_r, out_r, None, None, None, None, None, "32_BIT_UNSIGNED"
             )
             arcpy.management.Delete(mem_r)
+        elif aligned:
+            # nothing to re-encode, copy the dataset as is
+            arcpy.management.Copy(input_r, out_r)
         else:
             arcpy.management.CopyRaster(
                 input_r, out_r, None, None, None, None, None, "32_BIT_UNSIGNED"
@@ -492,25 +423,14 @@ def main(args: list[str, str, str, int, str]) ->str:
         
         # for unknown reason even though 5070 was specified above, these 
         # rasters not receiving the factor code (EPSG)
-        arcpy.management.DefineProjection(
-            out_r,
-            ('PROJCS["NAD_1983_Contiguous_USA_Albers",'
-             'GEOGCS["GCS_North_American_1983",'
-             'DATUM["D_North_American_1983",'
-             'SPHEROID["GRS_1980",6378137.0,298.257222101]],'
-             'PRIMEM["Greenwich",0.0],UNIT["Degree",0.0174532925199433]],'
-             'PROJECTION["Albers"],PARAMETER["False_Easting",0.0],'
-             'PARAMETER["False_Northing",0.0],'
-             'PARAMETER["Central_Meridian",-96.0],'
-             'PARAMETER["Standard_Parallel_1",29.5],'
-             'PARAMETER["Standard_Parallel_2",45.5],'
-             'PARAMETER["Latitude_Of_Origin",23.0],UNIT["Meter",1.0]]')
-        )
+        arcpy.management.DefineProjection(out_r, out_sr)
 
         # Rename Band_1, for some reason this doesn't display for rasters
-        # fgdb, yet when you export them the band name shows up. 
+        # fgdb, yet when you export them the band name shows up. A raster
+        # copied as is may already carry the MUKEY band name.
         rast = arcpy.Raster(out_r)
-        rast.renameBand('Band_1', 'MUKEY')
+        if 'Band_1' in rast.bandNames:
+            rast.renameBand('Band_1', 'MUKEY')
         del rast
 
         meta_b = UpdateMetadata(out_p, out_r, "10m", module_p, v, st)